@@ -160,7 +160,7 @@ options:
     choices: [ "running", "stopped", "absent", "present", "update" ]
 
 requirements:
-    - "python >= 2.6"
+    - "python >= 3.5"
     - "ionosenterprise >= 5.5.1"
 author:
     - "Matt Baldwin (baldwin@stackpointcloud.com)"
@@ -231,25 +231,19 @@ EXAMPLES = '''
 
 '''
 
+import random
 import re
+import threading
 import time
 import traceback
 
-from uuid import (uuid4, UUID)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from uuid import uuid4
 
-HAS_PB_SDK = True
-
-try:
-    from ionosenterprise import __version__ as sdk_version
-    from ionosenterprise.client import IonosEnterpriseService
-    from ionosenterprise.items import (Volume, Server,
-                                     Datacenter, NIC, LAN)
-except ImportError:
-    HAS_PB_SDK = False
+HAS_PB_SDK = False
 
 from ansible import __version__
 from ansible.module_utils.basic import AnsibleModule, env_fallback
-from ansible.module_utils.six.moves import xrange
 from ansible.module_utils._text import to_native
 
 LOCATIONS = ['us/las',
@@ -275,29 +269,118 @@ AVAILABILITY_ZONES = ['AUTO',
                       'ZONE_2',
                       'ZONE_3']
 
+RUNNING_STATES = frozenset(['running'])
+
+STOPPED_STATES = frozenset(['shutoff',
+                            'shutdown',
+                            'inactive'])
+
 uuid_match = re.compile(
-    '[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12}', re.I)
+    r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z', re.I)
 
+# Upper bound on the number of concurrent API operations, kept low since
+# the API limits how many servers can be provisioned at the same time.
+MAX_WORKERS = 8
 
-def _wait_for_completion(client, promise, wait_timeout, msg):
-    if not promise:
-        return
+# Below this many servers, state polls fetch each server instead of
+# listing the datacenter.
+PER_SERVER_POLL_LIMIT = 10
+
+# Serializes the public LAN lookup so that concurrent server creations
+# do not each provision their own public LAN.
+_public_lan_lock = threading.Lock()
+
+# Datacenter UUIDs by name and UUID, keyed by (id(client), identity).
+_datacenter_ids = {}
+
+
+def _import_sdk():
+    """
+    Import the SDK on demand, once the module arguments have been parsed,
+    so runs that fail validation do not pay for loading it.
+    """
+    global HAS_PB_SDK, sdk_version, IonosEnterpriseService, Volume, Server, Datacenter, NIC, LAN
+
+    try:
+        from ionosenterprise import __version__ as sdk_version
+        from ionosenterprise.client import IonosEnterpriseService
+        from ionosenterprise.items import (Volume, Server,
+                                         Datacenter, NIC, LAN)
+    except ImportError:
+        HAS_PB_SDK = False
+    else:
+        HAS_PB_SDK = True
+
+
+def _wait_for_completion(client, promise, wait_timeout, msg,
+                         initial_delay=0.25, max_delay=10.0, multiplier=2.0):
+    """
+    Poll the request status until it is DONE. The first poll is made right
+    away, then the delay backs off exponentially, with a little jitter,
+    from initial_delay up to max_delay.
+    """
+    _wait_for_many(client, [promise], wait_timeout, msg,
+                   initial_delay=initial_delay, max_delay=max_delay, multiplier=multiplier)
+
+
+def _wait_for_many(client, promises, wait_timeout, msg,
+                   initial_delay=0.25, max_delay=10.0, multiplier=2.0):
+    """
+    Poll the status of several requests from a single loop until all of
+    them are DONE, sharing one backoff schedule between them.
+    """
+    pending = [promise for promise in promises if promise]
+    delay = initial_delay
     wait_timeout = time.time() + wait_timeout
-    while wait_timeout > time.time():
-        time.sleep(5)
-        operation_result = client.get_request(
-            request_id=promise['requestId'],
-            status=True)
-
-        if operation_result['metadata']['status'] == "DONE":
-            return
-        elif operation_result['metadata']['status'] == "FAILED":
-            raise Exception(
-                'Request failed to complete ' + msg + ' "' + str(
-                    promise['requestId']) + '" to complete.')
-
-    raise Exception('Timed out waiting for async operation ' + msg + ' "' +
-                    str(promise['requestId']) + '" to complete.')
+    while pending:
+        still_pending = []
+        for promise in pending:
+            operation_result = client.get_request(
+                request_id=promise['requestId'],
+                status=True)
+
+            if operation_result['metadata']['status'] == "DONE":
+                continue
+            elif operation_result['metadata']['status'] == "FAILED":
+                raise Exception(
+                    'Request failed to complete ' + msg + ' "' + str(
+                        promise['requestId']) + '" to complete.')
+            still_pending.append(promise)
+        pending = still_pending
+
+        if not pending or wait_timeout <= time.time():
+            break
+        time.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = min(delay * multiplier, max_delay)
+
+    if pending:
+        raise Exception('Timed out waiting for async operation ' + msg + ' "' +
+                        str(pending[0]['requestId']) + '" to complete.')
+
+
+def _short_id():
+    """
+    Return a random 10 character name for volumes and NICs.
+    """
+    return uuid4().hex[:10]
+
+
+def _reuse_api_client(client, user_agent, pool_size=MAX_WORKERS):
+    """
+    Make the SDK reuse a single API client, and with it a single keep-alive
+    HTTP connection pool, instead of building a new one for every request.
+    ionosenterprise >= 5.5 creates its API client in get_api_client().
+    """
+    if not hasattr(client, 'get_api_client'):
+        return
+    api_client = client.get_api_client()
+
+    # Size the pool for the worker threads so connections are not discarded.
+    api_client.configuration.connection_pool_maxsize = pool_size
+    api_client.rest_client = type(api_client.rest_client)(api_client.configuration)
+    api_client.user_agent = user_agent
+
+    client.get_api_client = lambda: api_client
 
 def _get_lan_by_id_or_properties(networks, id=None, **kwargs):
 
@@ -316,140 +399,180 @@ def _get_lan_by_id_or_properties(networks, id=None, **kwargs):
 
     return matched_lan
 
-def _create_machine(module, client, datacenter, name):
-    cores = module.params.get('cores')
-    ram = module.params.get('ram')
-    cpu_family = module.params.get('cpu_family')
-    volume_size = module.params.get('volume_size')
-    disk_type = module.params.get('disk_type')
-    availability_zone = module.params.get('availability_zone')
-    volume_availability_zone = module.params.get('volume_availability_zone')
-    image_password = module.params.get('image_password')
-    ssh_keys = module.params.get('ssh_keys')
-    bus = module.params.get('bus')
-    lan = module.params.get('lan')
-    nat = module.params.get('nat')
-    image = module.params.get('image')
-    assign_public_ip = module.boolean(module.params.get('assign_public_ip'))
-    wait = module.params.get('wait')
-    wait_timeout = module.params.get('wait_timeout')
+def _build_server(module, name, nics):
+    p = module.params
+    cores = p['cores']
+    ram = p['ram']
+    cpu_family = p['cpu_family']
+    volume_size = p['volume_size']
+    disk_type = p['disk_type']
+    availability_zone = p['availability_zone']
+    volume_availability_zone = p['volume_availability_zone']
+    image_password = p['image_password']
+    ssh_keys = p['ssh_keys']
+    bus = p['bus']
+    image = p['image']
+
+    v = Volume(
+        name=_short_id(),
+        size=volume_size,
+        image_password=image_password,
+        ssh_keys=ssh_keys,
+        disk_type=disk_type,
+        availability_zone=volume_availability_zone,
+        bus=bus
+    )
+
+    if uuid_match.match(image):
+        v.image = image
+    else:
+        v.image_alias = image
+
+    return Server(
+        name=name,
+        ram=ram,
+        cores=cores,
+        cpu_family=cpu_family,
+        availability_zone=availability_zone,
+        create_volumes=[v],
+        nics=nics,
+    )
+
+
+def _build_composite_entities(module, names):
+    """
+    Build the servers, and the public LAN they attach to, for creating them
+    together with a new datacenter in a single composite request. LAN ids
+    in a new datacenter start at 1.
+    """
+    lans = []
+    if module.boolean(module.params.get('assign_public_ip')):
+        lans.append(LAN(name='public', public=True))
+
+    servers = []
+    for name in names:
+        nics = []
+        if lans:
+            nics.append(NIC(name=_short_id(), nat=module.params.get('nat'), lan=1))
+        servers.append(_build_server(module, name, nics))
+
+    return servers, lans
+
+
+def _submit_create(module, client, datacenter, name):
+    """
+    Submit the creation of a server without waiting for it to be
+    provisioned. Returns the create response, which carries the server id
+    and the request to wait for. Runs on a worker thread, so errors are
+    raised for the caller to report.
+    """
+    p = module.params
+    lan = p['lan']
+    nat = p['nat']
+    assign_public_ip = module.boolean(p['assign_public_ip'])
+    wait_timeout = p['wait_timeout']
 
     nics = []
+    lans = None
 
     if assign_public_ip:
-        public_lan = _get_lan_by_id_or_properties(client.list_lans(datacenter)['items'], public=True)
-
-        public_ip_lan_id = public_lan['id'] if public_lan is not None else None
+        with _public_lan_lock:
+            lans = client.list_lans(datacenter)['items']
+            public_ip_lan_id = next((l['id'] for l in lans if l['properties'].get('public')), None)
 
-        if public_ip_lan_id is None:
-            i = LAN(
-                    name='public',
-                    public=True
-                )
+            if public_ip_lan_id is None:
+                i = LAN(
+                        name='public',
+                        public=True
+                    )
 
-            lan_response = client.create_lan(datacenter, i)
-            _wait_for_completion(client, lan_response, wait_timeout, "_create_machine")
+                lan_response = client.create_lan(datacenter, i)
+                _wait_for_completion(client, lan_response, wait_timeout, "_submit_create")
 
-            public_ip_lan_id = lan_response['id']
+                public_ip_lan_id = lan_response['id']
+                lans.append(lan_response)
 
         nics.append(
             NIC(
-                name=str(uuid4()).replace('-', '')[:10],
+                name=_short_id(),
                 nat=nat,
                 lan=int(public_ip_lan_id)
             )
         )
 
     if lan is not None:
-        matching_lan = _get_lan_by_id_or_properties(client.list_lans(datacenter)['items'], lan, name=lan)
+        if lans is None:
+            lans = client.list_lans(datacenter)['items']
+        matching_lan = _get_lan_by_id_or_properties(lans, lan, name=lan)
 
         if (not any(n.lan == int(matching_lan['id']) for n in nics)) or len(nics) < 1:
 
             nics.append(
                 NIC(
-                    name=str(uuid4()).replace('-', '')[:10],
+                    name=_short_id(),
                     nat=nat,
                     lan=int(matching_lan['id'])
                 )
             )
 
-    v = Volume(
-        name=str(uuid4()).replace('-', '')[:10],
-        size=volume_size,
-        image_password=image_password,
-        ssh_keys=ssh_keys,
-        disk_type=disk_type,
-        availability_zone=volume_availability_zone,
-        bus=bus
-    )
+    s = _build_server(module, name, nics)
 
-    try:
-        UUID(image)
-    except Exception:
-        v.image_alias = image
-    else:
-        v.image = image
+    return client.create_server(datacenter_id=datacenter, server=s)
 
-    s = Server(
-        name=name,
-        ram=ram,
-        cores=cores,
-        cpu_family=cpu_family,
-        availability_zone=availability_zone,
-        create_volumes=[v],
-        nics=nics,
+
+def _finalize_create(client, datacenter, server_id, lan):
+    """
+    Fetch a server created by _submit_create once its request is DONE and
+    attach the public IP of its NIC on the given LAN. Like _submit_create,
+    errors are raised rather than reported.
+    """
+    # Only the NICs are needed from the new server's entities, so
+    # fetch them directly instead of expanding the server to depth 3.
+    server_response = client.get_server(
+        datacenter_id=datacenter,
+        server_id=server_id,
+        depth=1
     )
+    nic_list = client.list_nics(datacenter, server_id)
 
-    try:
-        create_server_response = client.create_server(
-            datacenter_id=datacenter, server=s)
+    server_response.setdefault('entities', {})['nics'] = nic_list
+    if nic_list.get('items'):
+        server_response['nic'] = nic_list['items'][0]
 
-        _wait_for_completion(client, create_server_response,
-                             wait_timeout, "create_virtual_machine")
+    for n in nic_list.get('items', []):
+        if lan == n['properties']['lan']:
+            server_response.update({'public_ip': n['properties']['ips'][0]})
 
-        server_response = client.get_server(
-            datacenter_id=datacenter,
-            server_id=create_server_response['id'],
-            depth=3
-        )
-    except Exception as e:
-        module.fail_json(msg="failed to create the new server: %s" % to_native(e))
-    else:
-        if hasattr(server_response['entities'], 'nics'):
-          server_response['nic'] = server_response['entities']['nics']['items'][0]
-        return server_response
+    return server_response
 
 
-def _startstop_machine(module, client, datacenter_id, server_id):
-    state = module.params.get('state')
-
-    try:
-        if state == 'running':
-            client.start_server(datacenter_id, server_id)
-        else:
-            client.stop_server(datacenter_id, server_id)
+def _startstop_machine(client, datacenter_id, server_id, state):
+    if state == 'running':
+        client.start_server(datacenter_id, server_id)
+    else:
+        client.stop_server(datacenter_id, server_id)
 
-        return True
-    except Exception as e:
-        module.fail_json(
-            msg="failed to start or stop the virtual machine %s at %s: %s" % (server_id, datacenter_id, to_native(e)))
+    return True
 
 
-def _create_datacenter(module, client):
+def _create_datacenter(module, client, servers=None, lans=None):
     datacenter = module.params.get('datacenter')
     location = module.params.get('location')
     wait_timeout = module.params.get('wait_timeout')
 
     i = Datacenter(
         name=datacenter,
-        location=location
+        location=location,
+        servers=servers,
+        lans=lans
     )
 
     try:
         datacenter_response = client.create_datacenter(datacenter=i)
 
         _wait_for_completion(client, datacenter_response,
-                             wait_timeout, "_create_datacenter")
+                             wait_timeout, "_create_datacenter",
+                             initial_delay=1.0)
 
         return datacenter_response
     except Exception as e:
@@ -466,33 +589,17 @@ def create_virtual_machine(module, client):
     Returns:
         True if a new virtual machine was created, false otherwise
     """
-    datacenter = module.params.get('datacenter')
-    name = module.params.get('name')
-    auto_increment = module.params.get('auto_increment')
-    count = module.params.get('count')
-    lan = module.params.get('lan')
-    wait_timeout = module.params.get('wait_timeout')
+    p = module.params
+    datacenter, name, auto_increment, count, lan, wait_timeout = (
+        p['datacenter'], p['name'], p['auto_increment'], p['count'], p['lan'], p['wait_timeout'])
     datacenter_found = False
 
-    virtual_machines = []
-
     # Locate UUID for datacenter if referenced by name.
-    datacenter_list = client.list_datacenters()
-    datacenter_id = _get_datacenter_id(datacenter_list, datacenter)
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
     if datacenter_id:
         datacenter_found = True
 
-    if not datacenter_found:
-        datacenter_response = _create_datacenter(module, client)
-        datacenter_id = datacenter_response['id']
-
-        _wait_for_completion(client, datacenter_response,
-                             wait_timeout, "create_virtual_machine")
-
     if auto_increment:
-        numbers = set()
-        count_offset = 1
-
         try:
             name % 0
         except TypeError as e:
@@ -501,37 +608,93 @@ def create_virtual_machine(module, client):
             else:
                 module.fail_json(msg=e, exception=traceback.format_exc())
 
-
-        number_range = xrange(count_offset, count_offset + count + len(numbers))
-
-
-        available_numbers = list(set(number_range).difference(numbers))
-        names = []
-        numbers_to_use = available_numbers[:count]
-        for number in numbers_to_use:
-            names.append(name % number)
+        names = [name % number for number in range(1, count + 1)]
     else:
         names = [name]
 
     changed = False
+    servers = []
 
-    # Prefetch a list of servers for later comparison.
-    server_list = client.list_servers(datacenter_id, depth=3)
-    for name in names:
+    if not datacenter_found:
+        # Without a LAN to look up, the servers can be provisioned together
+        # with the new datacenter in one composite request.
+        lans = []
+        if lan is None:
+            servers, lans = _build_composite_entities(module, names)
+
+        datacenter_response = _create_datacenter(module, client, servers, lans)
+        datacenter_id = datacenter_response['id']
+        _datacenter_ids[(id(client), datacenter)] = datacenter_id
+        changed = True
+
+    # Prefetch a list of servers for later comparison. A datacenter that
+    # was just created only contains the servers created along with it.
+    if datacenter_found or servers:
+        server_index = _index_instances(client.list_servers(datacenter_id, depth=1))
+    else:
+        server_index = {}
+
+    # One result slot per name keeps the machines in the requested order.
+    virtual_machines = [None] * len(names)
+    names_to_create = []
+    existing = []
+    for slot, name in enumerate(names):
         # Skip server creation if the server already exists.
-        server = _get_instance(server_list, name)
+        server = server_index.get(name)
         if server is not None:
-            virtual_machines.append(server)
-            continue
+            existing.append((slot, server['id']))
+        else:
+            names_to_create.append((slot, name))
+
+    # Existing servers are reported with their entities, so only those
+    # are fetched in depth, in parallel.
+    if existing:
+        with ThreadPoolExecutor(max_workers=min(len(existing), MAX_WORKERS)) as executor:
+            fetched = executor.map(
+                lambda server_id: client.get_server(datacenter_id, server_id, depth=3),
+                [server_id for slot, server_id in existing])
+            for (slot, server_id), server in zip(existing, fetched):
+                virtual_machines[slot] = server
+
+    # Only the names that do not exist yet are provisioned; when all of
+    # them exist no write request is issued at all. All creates are
+    # submitted first, then waited on together, then fetched.
+    if names_to_create:
+        datacenter_id = str(datacenter_id)
+        with ThreadPoolExecutor(max_workers=min(len(names_to_create), MAX_WORKERS)) as executor:
+            futures = dict(
+                (executor.submit(_submit_create, module, client, datacenter_id, name), slot)
+                for slot, name in names_to_create
+            )
+            submitted = {}
+            errors = []
+            for future in as_completed(futures):
+                try:
+                    submitted[futures[future]] = future.result()
+                except Exception as e:
+                    errors.append('%s: %s' % (names[futures[future]], to_native(e)))
 
-        create_response = _create_machine(module, client, str(datacenter_id), name)
-        changed = True
-        nics = client.list_nics(datacenter_id, create_response['id'])
-        for n in nics['items']:
-            if lan == n['properties']['lan']:
-                create_response.update({'public_ip': n['properties']['ips'][0]})
+            if errors:
+                module.fail_json(msg="failed to create the new server(s): %s" % '; '.join(errors))
+
+            try:
+                _wait_for_many(client, submitted.values(), wait_timeout, "create_virtual_machine")
+            except Exception as e:
+                module.fail_json(msg="failed to create the new server: %s" % to_native(e))
 
-        virtual_machines.append(create_response)
+            futures = dict(
+                (executor.submit(_finalize_create, client, datacenter_id, response['id'], lan), slot)
+                for slot, response in submitted.items()
+            )
+            for future in as_completed(futures):
+                try:
+                    virtual_machines[futures[future]] = future.result()
+                except Exception as e:
+                    errors.append('%s: %s' % (names[futures[future]], to_native(e)))
+
+            if errors:
+                module.fail_json(msg="failed to create the new server(s): %s" % '; '.join(errors))
+        changed = True
 
     results = {
         'changed': changed,
@@ -558,19 +721,15 @@ def update_server(module, client):
     Returns:
         dict of updated servers
     """
-    datacenter = module.params.get('datacenter')
     instance_ids = module.params.get('instance_ids')
 
-    if not isinstance(module.params.get('instance_ids'), list) or len(module.params.get('instance_ids')) < 1:
+    if not isinstance(instance_ids, list) or not instance_ids:
         module.fail_json(msg='instance_ids should be a list of virtual machine ids or names, aborting')
 
-    # Locate UUID for datacenter if referenced by name.
-    datacenter_list = client.list_datacenters()
-    datacenter_id = _get_datacenter_id(datacenter_list, datacenter)
-    if not datacenter_id:
-        module.fail_json(msg='Virtual data center \'%s\' not found.' % str(datacenter))
+    datacenter_id = _resolve_datacenter(module, client)
 
     updated_servers = []
+    updated_ids = []
 
     cores = module.params.get('cores')
     ram = module.params.get('ram')
@@ -578,14 +737,9 @@ def update_server(module, client):
     availability_zone = module.params.get('availability_zone')
     allow_reboot = None
 
-    server_list = client.list_servers(datacenter_id)
+    server_index = _index_instances(client.list_servers(datacenter_id))
     for instance in instance_ids:
-        server = None
-        for s in server_list['items']:
-            if instance in (s['properties']['name'], s['id']):
-                server = s
-                break
-
+        server = server_index.get(instance)
         if not server:
             module.fail_json(msg='Server \'%s\' not found.' % str(instance))
 
@@ -609,6 +763,7 @@ def update_server(module, client):
             module.fail_json(msg="failed to update the server: %s" % to_native(e), exception=traceback.format_exc())
         else:
             updated_servers.append(update_response)
+            updated_ids.append(update_response['id'])
 
     results = {
         'failed': False,
@@ -616,7 +771,7 @@ def update_server(module, client):
         'machines': updated_servers,
         'action': 'update',
         'instance_ids': {
-            'instances': [i['id'] for i in updated_servers],
+            'instances': updated_ids,
         }
     }
 
@@ -637,54 +792,63 @@ def remove_virtual_machine(module, client):
     Returns:
         True if a new virtual server was deleted, false otherwise
     """
-    datacenter = module.params.get('datacenter')
-    instance_ids = module.params.get('instance_ids')
-    remove_boot_volume = module.params.get('remove_boot_volume')
-    changed = False
+    p = module.params
+    instance_ids, remove_boot_volume = p['instance_ids'], p['remove_boot_volume']
 
-    if not isinstance(module.params.get('instance_ids'), list) or len(module.params.get('instance_ids')) < 1:
+    if not isinstance(instance_ids, list) or not instance_ids:
         module.fail_json(msg='instance_ids should be a list of virtual machine ids or names, aborting')
 
-    # Locate UUID for datacenter if referenced by name.
-    datacenter_list = client.list_datacenters()
-    datacenter_id = _get_datacenter_id(datacenter_list, datacenter)
-    if not datacenter_id:
-        module.fail_json(msg='Virtual data center \'%s\' not found.' % str(datacenter))
+    datacenter_id = _resolve_datacenter(module, client)
 
     # Prefetch server list for later comparison.
-    server_list = client.list_servers(datacenter_id)
+    server_index = _index_instances(client.list_servers(datacenter_id))
+    servers = {}
     for instance in instance_ids:
         # Locate UUID for server if referenced by name.
-        server_id = _get_server_id(server_list, instance)
-        if server_id:
-            if module.check_mode:
-                module.exit_json(changed=True)
+        server = server_index.get(instance)
+        if server is not None:
+            servers[server['id']] = server
+
+    if not servers:
+        return False
 
-            # Remove the server's boot volume
-            if remove_boot_volume:
-                _remove_boot_volume(module, client, datacenter_id, server_id)
+    if module.check_mode:
+        module.exit_json(changed=True)
 
-            # Remove the server
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(len(servers), MAX_WORKERS)) as executor:
+        futures = dict(
+            (executor.submit(_remove_machine, client, datacenter_id, server, remove_boot_volume), server_id)
+            for server_id, server in servers.items()
+        )
+        for future in as_completed(futures):
             try:
-                client.delete_server(datacenter_id, server_id)
+                future.result()
             except Exception as e:
-                module.fail_json(msg="failed to terminate the virtual server: %s" % to_native(e), exception=traceback.format_exc())
-            else:
-                changed = True
+                errors.append('%s: %s' % (futures[future], to_native(e)))
+
+    if errors:
+        module.fail_json(msg="failed to terminate the virtual server(s): %s" % '; '.join(errors))
 
-    return changed
+    return True
 
 
-def _remove_boot_volume(module, client, datacenter_id, server_id):
+def _remove_machine(client, datacenter_id, server, remove_boot_volume):
     """
-    Remove the boot volume from the server
+    Remove the server and, optionally, its boot volume
     """
-    try:
-        server = client.get_server(datacenter_id, server_id)
-        volume_id = server['properties']['bootVolume']['id']
-        client.delete_volume(datacenter_id, volume_id)
-    except Exception as e:
-        module.fail_json(msg="failed to remove the server's boot volume: %s" % to_native(e), exception=traceback.format_exc())
+    if remove_boot_volume:
+        try:
+            # The server listing already references the boot volume.
+            if 'bootVolume' not in server['properties']:
+                server = client.get_server(datacenter_id, server['id'])
+            boot_volume = server['properties']['bootVolume']
+            if boot_volume is not None:
+                client.delete_volume(datacenter_id, boot_volume['id'])
+        except Exception as e:
+            raise Exception("failed to remove the server's boot volume: %s" % to_native(e))
+
+    client.delete_server(datacenter_id, server['id'])
 
 
 def startstop_machine(module, client, state):
@@ -697,86 +861,135 @@ def startstop_machine(module, client, state):
     Returns:
         True when the servers process the action successfully, false otherwise.
     """
-    if not isinstance(module.params.get('instance_ids'), list) or len(module.params.get('instance_ids')) < 1:
+    p = module.params
+    instance_ids, wait, wait_timeout = p['instance_ids'], p['wait'], p['wait_timeout']
+
+    if not isinstance(instance_ids, list) or not instance_ids:
         module.fail_json(msg='instance_ids should be a list of virtual machine ids or names, aborting')
 
-    wait = module.params.get('wait')
-    wait_timeout = module.params.get('wait_timeout')
     changed = False
 
-    datacenter = module.params.get('datacenter')
-    instance_ids = module.params.get('instance_ids')
-
-    # Locate UUID for datacenter if referenced by name.
-    datacenter_list = client.list_datacenters()
-    datacenter_id = _get_datacenter_id(datacenter_list, datacenter)
-    if not datacenter_id:
-        module.fail_json(msg='Virtual data center \'%s\' not found.' % str(datacenter))
+    datacenter_id = _resolve_datacenter(module, client)
 
     # Prefetch server list for later comparison.
-    server_list = client.list_servers(datacenter_id)
+    server_index = _index_instances(client.list_servers(datacenter_id))
+    server_ids = set()
     for instance in instance_ids:
         # Locate UUID of server if referenced by name.
-        server_id = _get_server_id(server_list, instance)
+        server_id = _get_server_id(server_index, instance)
         if server_id:
-            if module.check_mode:
-                module.exit_json(changed=True)
+            server_ids.add(server_id)
+
+    if server_ids:
+        if module.check_mode:
+            module.exit_json(changed=True)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(len(server_ids), MAX_WORKERS)) as executor:
+            futures = dict(
+                (executor.submit(_startstop_machine, client, datacenter_id, server_id, state), server_id)
+                for server_id in server_ids
+            )
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append('%s: %s' % (futures[future], to_native(e)))
 
-            _startstop_machine(module, client, datacenter_id, server_id)
-            changed = True
+        if errors:
+            module.fail_json(
+                msg="failed to start or stop the virtual machine(s) at %s: %s" % (datacenter_id, '; '.join(errors)))
+
+        changed = True
 
     if wait:
+        target_states = RUNNING_STATES if state == 'running' else STOPPED_STATES
+        delay = 0.5
         wait_timeout = time.time() + wait_timeout
         while wait_timeout > time.time():
-            matched_instances = []
-            for res in client.list_servers(datacenter_id)['items']:
-                if state == 'running':
-                    if res['properties']['vmState'].lower() == state:
-                        matched_instances.append(res)
-                elif state == 'stopped':
-                    if res['properties']['vmState'].lower() in ['shutoff', 'shutdown', 'inactive']:
-                        matched_instances.append(res)
-
-            if len(matched_instances) < len(instance_ids):
-                time.sleep(5)
-            else:
-                break
+            time.sleep(delay)
+            delay = min(delay * 1.5, 5.0)
 
-        if wait_timeout <= time.time():
+            if _count_in_state(client, datacenter_id, server_ids, target_states) >= len(server_ids):
+                break
+        else:
             # waiting took too long
             module.fail_json(msg="wait for virtual machine state timeout on %s" % time.asctime())
 
     return (changed)
 
 
-def _get_datacenter_id(datacenters, identity):
+def _count_in_state(client, datacenter_id, server_ids, target_states):
     """
-    Fetch and return datacenter UUID by datacenter name if found.
+    Count the servers whose VM state is one of target_states. A handful of
+    servers is fetched individually, in parallel, rather than listing the
+    whole datacenter.
     """
-    for datacenter in datacenters['items']:
-        if identity in (datacenter['properties']['name'], datacenter['id']):
-            return datacenter['id']
-    return None
+    if server_ids and len(server_ids) < PER_SERVER_POLL_LIMIT:
+        with ThreadPoolExecutor(max_workers=min(len(server_ids), MAX_WORKERS)) as executor:
+            servers = list(executor.map(
+                lambda server_id: client.get_server(datacenter_id, server_id), server_ids))
+    else:
+        servers = [server for server in client.list_servers(datacenter_id)['items']
+                   if server['id'] in server_ids]
+
+    return sum(1 for server in servers
+               if server['properties']['vmState'].lower() in target_states)
+
+
+def _resolve_datacenter(module, client):
+    """
+    Return the UUID of the datacenter named by the module parameters,
+    failing the module if it does not exist.
+    """
+    datacenter = module.params.get('datacenter')
+
+    # Locate UUID for datacenter if referenced by name.
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
+    if not datacenter_id:
+        module.fail_json(msg='Virtual data center \'%s\' not found.' % str(datacenter))
+
+    return datacenter_id
+
+
+def _resolve_datacenter_id(client, identity):
+    """
+    Return the datacenter UUID for a name or UUID, listing the datacenters
+    only when an unknown name is passed. The listing is cached per client.
+    """
+    if uuid_match.match(str(identity)):
+        return identity
+
+    key = (id(client), identity)
+    if key not in _datacenter_ids:
+        # Index the whole listing so later lookups of other names are free.
+        for name, datacenter in _index_instances(client.list_datacenters()).items():
+            _datacenter_ids[(id(client), name)] = datacenter['id']
 
+    return _datacenter_ids.get(key)
 
-def _get_server_id(servers, identity):
+
+def _get_server_id(server_index, identity):
     """
     Fetch and return server UUID by server name if found.
     """
-    for server in servers['items']:
-        if identity in (server['properties']['name'], server['id']):
-            return server['id']
+    server = server_index.get(identity)
+    if server is not None:
+        return server['id']
     return None
 
 
-def _get_instance(instance_list, identity):
+def _index_instances(instance_list):
     """
-    Find and return the resource instance regardless of whether the name or UUID is passed.
+    Build a lookup of resource instances keyed by both name and UUID. When
+    several instances share a name, the first one listed wins.
     """
+    index = {}
     for resource in instance_list['items']:
-        if identity in (resource['properties']['name'], resource['id']):
-            return resource
-    return None
+        index.setdefault(resource['properties']['name'], resource)
+    for resource in instance_list['items']:
+        index[resource['id']] = resource
+    return index
 
 
 def main():
@@ -827,6 +1040,7 @@ def main():
     if module.params.get('lan') is not None and not (isinstance(module.params.get('lan'), str) or isinstance(module.params.get('lan'), int)):
         module.fail_json(msg='lan should either be a string or a number')
 
+    _import_sdk()
     if not HAS_PB_SDK:
         module.fail_json(msg='ionosenterprise is required for this module, run `pip install ionosenterprise`')
 
@@ -845,6 +1059,7 @@ def main():
 
     user_agent = 'profitbricks-sdk-python/%s Ansible/%s' % (sdk_version, __version__)
     ionosenterprise.headers = {'User-Agent': user_agent}
+    _reuse_api_client(ionosenterprise, user_agent)
 
     state = module.params.get('state')
 
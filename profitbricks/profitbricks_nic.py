@@ -28,7 +28,7 @@ options:
     required: true
   name:
     description:
-      - The name or ID of the NIC. This is only required on deletes, but not on create.
+      - The name or ID of the NIC. Required on updates and deletes, but not on create.
     required: true
   lan:
     description:
@@ -83,8 +83,18 @@ options:
     choices: [ "yes", "no" ]
   wait_timeout:
     description:
-      - how long before wait gives up, in seconds
+      - how long before wait gives up, in seconds. With 0 or less the request status is checked once, without waiting.
     default: 600
+  poll_interval:
+    description:
+      - how long to wait between the first status checks while waiting, in seconds. The interval grows with each check. Must be at least 1.
+    required: false
+    default: 2
+  poll_interval_max:
+    description:
+      - the longest interval between status checks while waiting, in seconds. Must not be less than poll_interval.
+    required: false
+    default: 30
   state:
     description:
       - Indicate desired state of the resource
@@ -132,6 +142,7 @@ EXAMPLES = '''
 
 '''
 
+import random
 import re
 import time
 
@@ -142,6 +153,7 @@ HAS_SDK = True
 try:
     from ionosenterprise import __version__ as sdk_version
     from ionosenterprise.client import IonosEnterpriseService
+    from ionosenterprise.errors import ICNotFoundError, ICRateLimitExceededError
     from ionosenterprise.items import NIC
 except ImportError:
     HAS_SDK = False
@@ -151,30 +163,195 @@ from ansible.module_utils.basic import AnsibleModule, env_fallback
 from ansible.module_utils._text import to_native
 
 uuid_match = re.compile(
-    '[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12}', re.I)
+    r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z', re.I)
+
+# Datacenter and server UUIDs by name, keyed by (id(client), ...). NICs are
+# not cached since this module creates and removes them.
+_resolved_ids = {}
 
 
-def _wait_for_completion(client, promise, wait_timeout, msg):
+class Waiter(object):
+    """
+    Polls a status until it reaches a terminal or failure state.
+
+    terminal_states : states that end the wait successfully
+    failure_states: states that end the wait with a failure
+    """
+
+    def __init__(self, terminal_states=('DONE',), failure_states=('FAILED',)):
+        self.terminal_states = frozenset(terminal_states)
+        self.failure_states = frozenset(failure_states)
+
+    def wait(self, fetch_status, timeout, delay_strategy):
+        """
+        Call fetch_status, sleeping delay_strategy(attempt) seconds between
+        calls, until it returns a terminal or failure state or timeout
+        seconds have passed. The first check is made immediately.
+
+        fetch_status : callable returning a (state, metadata) tuple
+        timeout: how long to wait, in seconds
+        delay_strategy: callable mapping the attempt number to a delay
+
+        Returns:
+            The final (state, metadata) tuple, or (None, None) on timeout
+        """
+        deadline = time.time() + timeout
+        attempt = 0
+        while True:
+            state, metadata = fetch_status()
+            if state in self.terminal_states or state in self.failure_states:
+                return state, metadata
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None, None
+            time.sleep(min(delay_strategy(attempt), remaining))
+            attempt += 1
+
+
+def _wait_for_completion(client, promise, wait_timeout, msg,
+                         poll_interval=2, poll_interval_max=30):
     if not promise:
         return
-    wait_timeout = time.time() + wait_timeout
-    while wait_timeout > time.time():
-        time.sleep(5)
-        operation_result = client.get_request(
-            request_id=promise['requestId'],
-            status=True)
-
-        if operation_result['metadata']['status'] == "DONE":
-            return
-        elif operation_result['metadata']['status'] == "FAILED":
-            raise Exception(
-                'Request failed to complete ' + msg + ' "' + str(
-                    promise['requestId']) + '" to complete.')
+
+    throttled = []
+
+    def fetch_status():
+        try:
+            operation_result = client.get_request(
+                request_id=promise['requestId'],
+                status=True)
+        except ICRateLimitExceededError:
+            throttled.append(True)
+            return None, None
+
+        del throttled[:]
+        return operation_result['metadata']['status'], operation_result['metadata']
+
+    def delay_strategy(attempt):
+        # Back off exponentially, with jitter, between status checks. When
+        # the API asked us to slow down, wait the longest interval.
+        if throttled:
+            delay = poll_interval_max
+        else:
+            delay = poll_interval * 1.5 ** min(attempt, 64)
+        return min(poll_interval_max, delay + random.uniform(0, 0.25) * delay)
+
+    state, metadata = Waiter().wait(fetch_status, max(wait_timeout or 0, 0), delay_strategy)
+
+    if state == "DONE":
+        return
+    elif state == "FAILED":
+        raise Exception(
+            'Request failed to complete ' + msg + ' "' + str(
+                promise['requestId']) + '" to complete.')
+    elif not wait_timeout or wait_timeout <= 0:
+        # A wait_timeout of 0 or less checks the request once, without
+        # waiting for it.
+        return
 
     raise Exception('Timed out waiting for async operation ' + msg + ' "' +
                     str(promise['requestId']) + '" to complete.')
 
 
+def _reuse_api_client(client, user_agent):
+    """
+    Make the SDK reuse a single API client, and with it a single keep-alive
+    HTTP connection pool, instead of building a new one for every request.
+    NIC requests are issued one at a time, so the pool keeps its size.
+    """
+    if not hasattr(client, 'get_api_client'):
+        return
+    api_client = client.get_api_client()
+    api_client.user_agent = user_agent
+
+    client.get_api_client = lambda: api_client
+
+
+def _is_uuid(value):
+    """
+    Return True if the whole of value is a UUID.
+    """
+    return uuid_match.match(str(value)) is not None
+
+
+def _resolve_datacenter_id(client, datacenter):
+    """
+    Return the UUID of a datacenter referenced by name or UUID, or None if
+    no datacenter has that name. Shares _resolved_ids with the server names.
+    """
+    if _is_uuid(datacenter):
+        return datacenter
+
+    key = (id(client), datacenter)
+    if key not in _resolved_ids:
+        for d in client.list_datacenters(depth=1)['items']:
+            _resolved_ids[(id(client), d['properties']['name'])] = d['id']
+
+    return _resolved_ids.get(key)
+
+
+def _resolve_server_id(client, datacenter, server):
+    """
+    Return the UUID of a server referenced by name or UUID, or None if no
+    server in the datacenter has that name.
+    """
+    if _is_uuid(server):
+        return server
+
+    key = (id(client), datacenter, server)
+    if key not in _resolved_ids:
+        for s in client.list_servers(datacenter)['items']:
+            _resolved_ids[(id(client), datacenter, s['properties']['name'])] = s['id']
+
+    return _resolved_ids.get(key)
+
+
+def _resolve_nic(client, datacenter, server, name):
+    """
+    Return the NIC referenced by name or UUID, or None if the server has
+    no such NIC. A UUID is fetched directly instead of listing the NICs.
+    """
+    if _is_uuid(name):
+        try:
+            return client.get_nic(datacenter, server, name)
+        except ICNotFoundError:
+            return None
+
+    nic_list = client.list_nics(datacenter, server)
+    return next((n for n in nic_list['items'] if n['properties']['name'] == name), None)
+
+
+def _resolve_datacenter(module, client):
+    """
+    Return the UUID of the datacenter named by the module parameters,
+    failing the module if it does not exist.
+    """
+    datacenter = module.params.get('datacenter')
+
+    # Locate UUID for Datacenter
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
+    if not datacenter_id:
+        module.fail_json(msg='Virtual data center \'%s\' not found.' % str(datacenter))
+
+    return datacenter_id
+
+
+def _resolve_server(module, client, datacenter):
+    """
+    Return the UUID of the server named by the module parameters, failing
+    the module if it does not exist.
+    """
+    server = module.params.get('server')
+
+    # Locate UUID for Server
+    server_id = _resolve_server_id(client, datacenter, server)
+    if not server_id:
+        module.fail_json(msg='Server \'%s\' not found.' % str(server))
+
+    return server_id
+
+
 def create_nic(module, client):
     """
     Creates a NIC.
@@ -185,8 +362,6 @@ def create_nic(module, client):
     Returns:
         The NIC instance being created
     """
-    datacenter = module.params.get('datacenter')
-    server = module.params.get('server')
     lan = module.params.get('lan')
     dhcp = module.params.get('dhcp') or False
     nat = module.params.get('nat') or False
@@ -195,30 +370,19 @@ def create_nic(module, client):
     name = module.params.get('name')
     wait = module.params.get('wait')
     wait_timeout = module.params.get('wait_timeout')
+    poll_interval = module.params.get('poll_interval')
+    poll_interval_max = module.params.get('poll_interval_max')
 
-    # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = client.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = client.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                break
-
-    # Locate UUID for Server
-    if not (uuid_match.match(server)):
-        server_list = client.list_servers(datacenter)
-        for s in server_list['items']:
-            if server == s['properties']['name']:
-                server = s['id']
-                break
+    datacenter = _resolve_datacenter(module, client)
+    server = _resolve_server(module, client, datacenter)
 
-    nic_list = client.list_nics(datacenter, server)
-    nic = None
-    for n in nic_list['items']:
-        if name == n['properties']['name']:
-            nic = n
-            break
+    # A generated name cannot match an existing NIC, so there is nothing
+    # to look up.
+    if name:
+        nic = _resolve_nic(client, datacenter, server, name)
+    else:
+        name = uuid4().hex[:10]
+        nic = None
 
     should_change = nic is None
 
@@ -245,10 +409,14 @@ def create_nic(module, client):
 
         if wait:
             _wait_for_completion(client, nic_response,
-                                 wait_timeout, 'create_nic')
+                                 wait_timeout, 'create_nic',
+                                 poll_interval, poll_interval_max)
 
-        # Refresh NIC properties
-        nic_response = client.get_nic(datacenter, server, nic_response['id'])
+            # Refresh NIC properties, such as the MAC and IPs assigned
+            # while provisioning.
+            nic_response = client.get_nic(datacenter, server, nic_response['id'])
+        elif 'properties' not in nic_response:
+            nic_response = client.get_nic(datacenter, server, nic_response['id'])
 
         return {
             'changed': True,
@@ -269,8 +437,6 @@ def update_nic(module, client):
     Returns:
         The NIC instance being updated
     """
-    datacenter = module.params.get('datacenter')
-    server = module.params.get('server')
     lan = module.params.get('lan')
     nat = module.params.get('nat')
     dhcp = module.params.get('dhcp')
@@ -279,32 +445,14 @@ def update_nic(module, client):
     name = module.params.get('name')
     wait = module.params.get('wait')
     wait_timeout = module.params.get('wait_timeout')
+    poll_interval = module.params.get('poll_interval')
+    poll_interval_max = module.params.get('poll_interval_max')
 
-    # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = client.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = client.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                break
+    datacenter = _resolve_datacenter(module, client)
+    server = _resolve_server(module, client, datacenter)
 
-    # Locate UUID for Server
-    if not (uuid_match.match(server)):
-        server_list = client.list_servers(datacenter)
-        for s in server_list['items']:
-            if server == s['properties']['name']:
-                server = s['id']
-                break
-
-    nic = None
     # Locate NIC to update
-    nic_list = client.list_nics(datacenter, server)
-    for n in nic_list['items']:
-        if name == n['properties']['name'] or name == n['id']:
-            nic = n
-            break
-
+    nic = _resolve_nic(client, datacenter, server, name)
     if not nic:
         module.fail_json(msg="NIC could not be found.")
 
@@ -312,14 +460,15 @@ def update_nic(module, client):
         module.exit_json(changed=True)
 
     try:
+        props = nic['properties']
         if lan is None:
-            lan = nic['properties']['lan']
+            lan = props.get('lan')
         if firewall_active is None:
-            firewall_active = nic['properties']['firewallActive']
+            firewall_active = props.get('firewallActive')
         if nat is None:
-            nat = nic['properties']['nat']
+            nat = props.get('nat')
         if dhcp is None:
-            dhcp = nic['properties']['dhcp']
+            dhcp = props.get('dhcp')
 
         nic_response = client.update_nic(
             datacenter,
@@ -334,10 +483,12 @@ def update_nic(module, client):
 
         if wait:
             _wait_for_completion(client, nic_response,
-                                 wait_timeout, 'update_nic')
+                                 wait_timeout, 'update_nic',
+                                 poll_interval, poll_interval_max)
 
-        # Refresh NIC properties
-        nic_response = client.get_nic(datacenter, server, nic_response['id'])
+        # The update response already carries the NIC properties.
+        if 'properties' not in nic_response:
+            nic_response = client.get_nic(datacenter, server, nic_response['id'])
 
         return {
             'changed': True,
@@ -363,39 +514,21 @@ def delete_nic(module, client):
     name = module.params.get('name')
 
     # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = client.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = client.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                break
+    datacenter = _resolve_datacenter_id(client, datacenter)
+    if not datacenter:
+        return False
 
     # Locate UUID for Server
-    server_found = False
-    if not (uuid_match.match(server)):
-        server_list = client.list_servers(datacenter)
-        for s in server_list['items']:
-            if server == s['properties']['name']:
-                server_found = True
-                server = s['id']
-                break
-
-        if not server_found:
-            return False
+    server = _resolve_server_id(client, datacenter, server)
+    if not server:
+        return False
 
     # Locate UUID for NIC
-    nic_found = False
-    if not (uuid_match.match(name)):
-        nic_list = client.list_nics(datacenter, server)
-        for n in nic_list['items']:
-            if name == n['properties']['name']:
-                nic_found = True
-                name = n['id']
-                break
-
-        if not nic_found:
+    if not _is_uuid(name):
+        nic = _resolve_nic(client, datacenter, server, name)
+        if not nic:
             return False
+        name = nic['id']
 
     if module.check_mode:
         module.exit_json(changed=True)
@@ -412,7 +545,7 @@ def main():
         argument_spec=dict(
             datacenter=dict(type='str'),
             server=dict(type='str'),
-            name=dict(type='str', default=str(uuid4()).replace('-', '')[:10]),
+            name=dict(type='str', default=None),
             lan=dict(type='int', default=None),
             dhcp=dict(type='bool', default=None),
             nat=dict(type='bool', default=None),
@@ -434,6 +567,8 @@ def main():
             ),
             wait=dict(type='bool', default=True),
             wait_timeout=dict(type='int', default=600),
+            poll_interval=dict(type='int', default=2),
+            poll_interval_max=dict(type='int', default=30),
             state=dict(type='str', default='present'),
         ),
         supports_check_mode=True
@@ -446,6 +581,10 @@ def main():
         module.fail_json(msg='datacenter parameter is required')
     if not module.params.get('server'):
         module.fail_json(msg='server parameter is required')
+    if module.params.get('poll_interval') < 1:
+        module.fail_json(msg='poll_interval must be at least 1 second')
+    if module.params.get('poll_interval_max') < module.params.get('poll_interval'):
+        module.fail_json(msg='poll_interval_max must not be less than poll_interval')
 
     username = module.params.get('username')
     password = module.params.get('password')
@@ -462,6 +601,7 @@ def main():
 
     user_agent = 'profitbricks-sdk-python/%s Ansible/%s' % (sdk_version, __version__)
     ionosenterprise.headers = {'User-Agent': user_agent}
+    _reuse_api_client(ionosenterprise, user_agent)
 
     state = module.params.get('state')
 
@@ -486,6 +626,9 @@ def main():
             module.fail_json(msg='failed to set nic state: %s' % to_native(e))
 
     elif state == 'update':
+        if not module.params.get('name'):
+            module.fail_json(msg='name parameter is required')
+
         try:
             (nic_dict) = update_nic(module, ionosenterprise)
             module.exit_json(**nic_dict)
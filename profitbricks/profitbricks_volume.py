@@ -118,7 +118,7 @@ options:
     choices: ["present", "absent", "update"]
 
 requirements:
-    - "python >= 2.6"
+    - "python >= 3.5"
     - "ionosenterprise >= 5.5.1"
 author:
     - "Matt Baldwin (baldwin@stackpointcloud.com)"
@@ -161,10 +161,11 @@ EXAMPLES = '''
 
 '''
 
-import re
+import random
 import time
 import traceback
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import UUID
 
 HAS_SDK = True
@@ -178,7 +179,6 @@ except ImportError:
 
 from ansible import __version__
 from ansible.module_utils.basic import AnsibleModule, env_fallback
-from ansible.module_utils.six.moves import xrange
 from ansible.module_utils._text import to_native
 
 DISK_TYPES = ['HDD',
@@ -198,16 +198,20 @@ LICENCE_TYPES = ['LINUX',
                  'OTHER',
                  'WINDOWS2016']
 
-uuid_match = re.compile(
-    '[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12}', re.I)
+# Upper bound on the number of concurrent API operations.
+MAX_WORKERS = 8
 
+# Datacenter UUIDs by name and UUID, keyed by (id(client), identity).
+_datacenter_ids = {}
 
-def _wait_for_completion(client, promise, wait_timeout, msg):
+
+def _wait_for_completion(client, promise, wait_timeout, msg,
+                         initial_delay=0.25, max_delay=5.0):
     if not promise:
         return
-    wait_timeout = time.time() + wait_timeout
-    while wait_timeout > time.time():
-        time.sleep(5)
+    delay = initial_delay
+    deadline = time.monotonic() + wait_timeout
+    while True:
         operation_result = client.get_request(
             request_id=promise['requestId'],
             status=True)
@@ -219,61 +223,72 @@ def _wait_for_completion(client, promise, wait_timeout, msg):
                 'Request failed to complete ' + msg + ' "' + str(
                     promise['requestId']) + '" to complete.')
 
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Back off exponentially, with jitter, between status checks, but
+        # never sleep past the deadline.
+        time.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+        delay = min(delay * 1.7, max_delay)
+
     raise Exception('Timed out waiting for async operation ' + msg + ' "' +
                     str(promise['requestId']) + '" to complete.')
 
 
-def _create_volume(module, client, datacenter, name):
-    size = module.params.get('size')
-    bus = module.params.get('bus')
-    image = module.params.get('image')
-    image_password = module.params.get('image_password')
-    ssh_keys = module.params.get('ssh_keys')
-    disk_type = module.params.get('disk_type')
-    availability_zone = module.params.get('availability_zone')
-    licence_type = module.params.get('licence_type')
-    wait_timeout = module.params.get('wait_timeout')
-    wait = module.params.get('wait')
-
-    if module.check_mode:
-        module.exit_json(changed=True)
-
-    try:
-        v = Volume(
-            name=name,
-            size=size,
-            bus=bus,
-            image_password=image_password,
-            ssh_keys=ssh_keys,
-            disk_type=disk_type,
-            licence_type=licence_type,
-            availability_zone=availability_zone
-        )
+def _reuse_api_client(client, user_agent, pool_size=MAX_WORKERS):
+    """
+    Make the SDK reuse a single API client, and with it a single keep-alive
+    HTTP connection pool, instead of building a new one for every request.
+    The pool is sized for the worker threads.
+    """
+    if not hasattr(client, 'get_api_client'):
+        return
+    api_client = client.get_api_client()
+    api_client.configuration.connection_pool_maxsize = pool_size
+    api_client.rest_client = type(api_client.rest_client)(api_client.configuration)
+    api_client.user_agent = user_agent
 
-        try:
-            UUID(image)
-        except Exception:
-            v.image_alias = image
-        else:
-            v.image = image
+    client.get_api_client = lambda: api_client
 
-        volume_response = client.create_volume(datacenter, v)
 
-        if wait:
-            _wait_for_completion(client, volume_response,
-                                 wait_timeout, "_create_volume")
+def _create_volume(module, client, datacenter, name):
+    """
+    Submit the creation of a volume without waiting for it. Runs on a
+    worker thread, so errors are raised for the caller to report.
+    """
+    p = module.params
+    size = p['size']
+    bus = p['bus']
+    image = p['image']
+    image_password = p['image_password']
+    ssh_keys = p['ssh_keys']
+    disk_type = p['disk_type']
+    availability_zone = p['availability_zone']
+    licence_type = p['licence_type']
+
+    v = Volume(
+        name=name,
+        size=size,
+        bus=bus,
+        image_password=image_password,
+        ssh_keys=ssh_keys,
+        disk_type=disk_type,
+        licence_type=licence_type,
+        availability_zone=availability_zone
+    )
 
-    except Exception as e:
-        module.fail_json(msg="failed to create the volume: %s" % to_native(e))
+    if _is_uuid(image):
+        v.image = image
+    else:
+        v.image_alias = image
 
-    return volume_response
+    return client.create_volume(datacenter, v)
 
 
-def _update_volume(module, client, datacenter, volume):
-    size = module.params.get('size')
-    bus = module.params.get('bus')
-    wait_timeout = module.params.get('wait_timeout')
-    wait = module.params.get('wait')
+def _update_volume(module, client, datacenter, volume, wait, wait_timeout):
+    p = module.params
+    size = p['size']
+    bus = p['bus']
 
     if module.check_mode:
         module.exit_json(changed=True)
@@ -296,15 +311,6 @@ def _update_volume(module, client, datacenter, volume):
     return volume_response
 
 
-def _delete_volume(module, client, datacenter, volume):
-    if module.check_mode:
-        module.exit_json(changed=True)
-    try:
-        client.delete_volume(datacenter, volume)
-    except Exception as e:
-        module.fail_json(msg="failed to remove the volume: %s" % to_native(e))
-
-
 def create_volume(module, client):
     """
     Create volumes.
@@ -317,59 +323,95 @@ def create_volume(module, client):
     Returns:
         dict of created volumes
     """
-    datacenter = module.params.get('datacenter')
-    name = module.params.get('name')
-    auto_increment = module.params.get('auto_increment')
-    count = module.params.get('count')
+    p = module.params
+    datacenter = p['datacenter']
+    name = p['name']
+    server = p['server']
+    auto_increment = p['auto_increment']
+    count = p['count']
+    wait = p['wait']
+    wait_timeout = p['wait_timeout']
 
-    datacenter_found = False
     volumes = []
 
-    datacenter_list = client.list_datacenters()
-    for d in datacenter_list['items']:
-        dc = client.get_datacenter(d['id'])
-        if datacenter in [dc['properties']['name'], dc['id']]:
-            datacenter = d['id']
-            datacenter_found = True
-            break
-
-    if not datacenter_found:
+    # Locate UUID for Datacenter
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
+    if not datacenter_id:
         module.fail_json(msg='datacenter could not be found.')
+    datacenter = datacenter_id
 
     if auto_increment:
-        numbers = set()
-        count_offset = 1
-
-        try:
-            name % 0
-        except TypeError as e:
-            if (hasattr(e, 'message') and e.message.startswith('not all') or to_native(e).startswith('not all')):
-                name = '%s%%d' % name
-            else:
-                module.fail_json(msg=e.message, exception=traceback.format_exc())
-
-        number_range = xrange(count_offset, count_offset + count + len(numbers))
-        available_numbers = list(set(number_range).difference(numbers))
-        names = []
-        numbers_to_use = available_numbers[:count]
-        for number in numbers_to_use:
-            names.append(name % number)
+        # Names without any '%' cannot hold a format specifier; only probe
+        # the others by formatting them.
+        if '%' not in name:
+            name = '%s%%d' % name
+        else:
+            try:
+                name % 0
+            except TypeError as e:
+                if to_native(e).startswith('not all'):
+                    name = '%s%%d' % name
+                else:
+                    module.fail_json(msg=to_native(e), exception=traceback.format_exc())
+
+        names = [name % number for number in range(1, count + 1)]
     else:
         names = [name] * count
 
     changed = False
 
-    # Prefetch a list of volumes for later comparison.
-    volume_list = client.list_volumes(datacenter)
-
-    for name in names:
-        # Skip volume creation if a volume with the same name already exists.
-        if _get_instance_id(volume_list, name):
-            continue
-
-        create_response = _create_volume(module, client, str(datacenter), name)
-        volumes.append(create_response)
-        _attach_volume(module, client, datacenter, create_response['id'])
+    # Prefetch the names and UUIDs of the volumes for later comparison.
+    existing = set()
+    for v in client.list_volumes(datacenter, depth=1)['items']:
+        existing.add(v['properties']['name'])
+        existing.add(v['id'])
+
+    # Skip volume creation if a volume with the same name already exists.
+    names_to_create = [name for name in names if name not in existing]
+
+    if names_to_create:
+        # Locate UUID for Server once, before anything is created.
+        server_id = None
+        if server:
+            server_id = _resolve_server_id(client, datacenter, server)
+            if not server_id:
+                module.fail_json(msg='server could not be found.')
+
+        if module.check_mode:
+            module.exit_json(changed=True)
+
+        # Submit all creates first and wait for them together, so that the
+        # volumes are provisioned in parallel.
+        with ThreadPoolExecutor(max_workers=min(len(names_to_create), MAX_WORKERS)) as executor:
+            futures = dict(
+                (executor.submit(_create_volume, module, client, str(datacenter), name), slot)
+                for slot, name in enumerate(names_to_create)
+            )
+            volumes = [None] * len(names_to_create)
+            errors = []
+            for future in as_completed(futures):
+                try:
+                    volumes[futures[future]] = future.result()
+                except Exception as e:
+                    errors.append('%s: %s' % (names_to_create[futures[future]], to_native(e)))
+
+            if errors:
+                module.fail_json(msg="failed to create the volume(s): %s" % '; '.join(errors))
+
+            if wait:
+                try:
+                    list(executor.map(
+                        lambda volume: _wait_for_completion(client, volume, wait_timeout, "_create_volume"),
+                        volumes))
+                except Exception as e:
+                    module.fail_json(msg="failed to create the volume: %s" % to_native(e))
+
+        # Attach one volume at a time, since the server is locked while a
+        # volume is being attached.
+        if server_id:
+            for volume in volumes:
+                _attach_volume(module, client, datacenter, volume['id'], server_id,
+                               wait, wait_timeout)
         changed = True
 
     results = {
@@ -397,38 +439,42 @@ def update_volume(module, client):
     Returns:
         dict of updated volumes
     """
-    datacenter = module.params.get('datacenter')
-    instance_ids = module.params.get('instance_ids')
+    p = module.params
+    datacenter = p['datacenter']
+    instance_ids = p['instance_ids']
+    size = p['size']
+    bus = p['bus']
+    wait = p['wait']
+    wait_timeout = p['wait_timeout']
 
-    datacenter_found = False
     failed = True
     changed = False
     volumes = []
 
-    datacenter_list = client.list_datacenters()
-    for d in datacenter_list['items']:
-        dc = client.get_datacenter(d['id'])
-        if datacenter in [dc['properties']['name'], dc['id']]:
-            datacenter = d['id']
-            datacenter_found = True
-            break
-
-    if not datacenter_found:
+    # Locate UUID for Datacenter
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
+    if not datacenter_id:
         module.fail_json(msg='datacenter could not be found.')
+    datacenter = datacenter_id
 
+    # The listing doubles as the current state, so volumes that already
+    # have the requested size and bus are left alone.
+    volume_list = client.list_volumes(datacenter, depth=1)['items']
+    volumes_by_id = dict((v['id'], v) for v in volume_list)
     for n in instance_ids:
-        if(uuid_match.match(n)):
-            update_response = _update_volume(module, client, datacenter, n)
-            changed = True
+        if _is_uuid(n):
+            matches = [volumes_by_id.get(n, {'id': n})]
         else:
-            volume_list = client.list_volumes(datacenter)
-            for v in volume_list['items']:
-                if n == v['properties']['name']:
-                    volume_id = v['id']
-                    update_response = _update_volume(module, client, datacenter, volume_id)
-                    changed = True
-
-        volumes.append(update_response)
+            matches = [v for v in volume_list if v['properties']['name'] == n]
+
+        for v in matches:
+            props = v.get('properties', {})
+            if props.get('size') == size and props.get('bus') == bus:
+                volumes.append(v)
+                continue
+            volumes.append(_update_volume(module, client, datacenter, v['id'],
+                                          wait, wait_timeout))
+            changed = True
         failed = False
 
     results = {
@@ -460,34 +506,55 @@ def delete_volume(module, client):
         module.fail_json(msg='instance_ids should be a list of volume ids or names, aborting')
 
     datacenter = module.params.get('datacenter')
-    changed = False
     instance_ids = module.params.get('instance_ids')
 
     # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = client.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = client.get_datacenter(d['id'])
-            if datacenter in [dc['properties']['name'], dc['id']]:
-                datacenter = d['id']
-                break
+    datacenter_id = _resolve_datacenter_id(client, datacenter)
+    if not datacenter_id:
+        module.fail_json(msg='datacenter could not be found.')
+    datacenter = datacenter_id
 
+    # Volumes are listed at most once, on the first name to resolve.
+    volume_ids = None
+    to_delete = []
     for n in instance_ids:
-        if(uuid_match.match(n)):
-            _delete_volume(module, client, datacenter, n)
-            changed = True
+        if _is_uuid(n):
+            ids = [n]
         else:
-            volumes = client.list_volumes(datacenter)
-            for v in volumes['items']:
-                if n == v['properties']['name']:
-                    volume_id = v['id']
-                    _delete_volume(module, client, datacenter, volume_id)
-                    changed = True
+            if volume_ids is None:
+                volume_ids = _volume_ids_by_name(client.list_volumes(datacenter, depth=1))
+            ids = volume_ids.get(n, [])
+
+        for volume_id in ids:
+            if volume_id not in to_delete:
+                to_delete.append(volume_id)
 
-    return changed
+    if not to_delete:
+        return False
 
+    if module.check_mode:
+        module.exit_json(changed=True)
 
-def _attach_volume(module, client, datacenter, volume):
+    # The deletes are independent of each other, so issue them in parallel.
+    errors = []
+    with ThreadPoolExecutor(max_workers=min(len(to_delete), MAX_WORKERS)) as executor:
+        futures = dict(
+            (executor.submit(client.delete_volume, datacenter, volume_id), volume_id)
+            for volume_id in to_delete
+        )
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors.append('%s: %s' % (futures[future], to_native(e)))
+
+    if errors:
+        module.fail_json(msg="failed to remove the volume(s): %s" % '; '.join(errors))
+
+    return True
+
+
+def _attach_volume(module, client, datacenter, volume, server_id, wait, wait_timeout):
     """
     Attaches a volume.
 
@@ -495,35 +562,78 @@ def _attach_volume(module, client, datacenter, volume):
 
     module : AnsibleModule object
     client: authenticated ionosenterprise object.
+    server_id: UUID of the server, resolved once by the caller.
 
     Returns:
         the volume instance being attached
     """
-    server = module.params.get('server')
+    try:
+        attach_response = client.attach_volume(datacenter, server_id, volume)
 
-    # Locate UUID for Server
-    if server:
-        if not (uuid_match.match(server)):
-            server_list = client.list_servers(datacenter)
-            for s in server_list['items']:
-                if server == s['properties']['name']:
-                    server = s['id']
-                    break
+        if wait:
+            _wait_for_completion(client, attach_response,
+                                 wait_timeout, "_attach_volume")
 
-        try:
-            return client.attach_volume(datacenter, server, volume)
-        except Exception as e:
-            module.fail_json(msg='failed to attach volume: %s' % to_native(e))
+        return attach_response
+    except Exception as e:
+        module.fail_json(msg='failed to attach volume: %s' % to_native(e))
 
 
-def _get_instance_id(instance_list, identity):
+def _resolve_server_id(client, datacenter, server):
     """
-    Return instance UUID by name or ID, if found.
+    Return the UUID of a server referenced by name or UUID, or None if no
+    server in the datacenter has that name. Not cached, since a run looks
+    up at most one server.
     """
-    for i in instance_list['items']:
-        if identity in (i['properties']['name'], i['id']):
-            return i['id']
-    return None
+    if _is_uuid(server):
+        return server
+
+    server_list = client.list_servers(datacenter)
+    return next((s['id'] for s in server_list['items'] if s['properties']['name'] == server), None)
+
+
+def _is_uuid(value):
+    """
+    Return True if value parses as a UUID.
+    """
+    # Names and image aliases almost never have the canonical UUID shape,
+    # so they are rejected without going through the UUID parser.
+    if not isinstance(value, str) or len(value) != 36 or value.count('-') != 4:
+        return False
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _resolve_datacenter_id(client, identity):
+    """
+    Return the UUID of a datacenter referenced by name or UUID, or None if
+    no datacenter has that name. Names are cached in _datacenter_ids.
+    """
+    if _is_uuid(identity):
+        return identity
+
+    key = (id(client), identity)
+    if key not in _datacenter_ids:
+        # The listing already carries the names, so no per-datacenter GET
+        # is needed. Index all of it so later lookups of other names are free.
+        for d in client.list_datacenters()['items']:
+            _datacenter_ids[(id(client), d['properties']['name'])] = d['id']
+            _datacenter_ids[(id(client), d['id'])] = d['id']
+
+    return _datacenter_ids.get(key)
+
+
+def _volume_ids_by_name(volume_list):
+    """
+    Map each volume name to the UUIDs of the volumes with that name.
+    """
+    volume_ids = {}
+    for v in volume_list['items']:
+        volume_ids.setdefault(v['properties']['name'], []).append(v['id'])
+    return volume_ids
 
 
 def main():
@@ -567,6 +677,26 @@ def main():
     if not HAS_SDK:
         module.fail_json(msg='ionosenterprise is required for this module, run `pip install ionosenterprise`')
 
+    state = module.params.get('state')
+
+    # Validate the parameters before any SDK client is built.
+    if state == 'absent':
+        if not module.params.get('datacenter'):
+            module.fail_json(msg='datacenter parameter is required for creating, updating or deleting volumes.')
+    elif state == 'present':
+        if not module.params.get('datacenter'):
+            module.fail_json(msg='datacenter parameter is required for new instance')
+        if not module.params.get('name'):
+            module.fail_json(msg='name parameter is required for new instance')
+
+    actions = {
+        'absent': (delete_volume, 'failed to set volume state'),
+        'present': (create_volume, 'failed to set volume state'),
+        'update': (update_volume, 'failed to update volume'),
+    }
+    if state not in actions:
+        return
+
     username = module.params.get('username')
     password = module.params.get('password')
     api_url = module.params.get('api_url')
@@ -582,37 +712,17 @@ def main():
 
     user_agent = 'profitbricks-sdk-python/%s Ansible/%s' % (sdk_version, __version__)
     ionosenterprise.headers = {'User-Agent': user_agent}
+    _reuse_api_client(ionosenterprise, user_agent)
 
-    state = module.params.get('state')
+    action, error_msg = actions[state]
+    try:
+        result = action(module, ionosenterprise)
+    except Exception as e:
+        module.fail_json(msg='%s: %s' % (error_msg, to_native(e)))
 
     if state == 'absent':
-        if not module.params.get('datacenter'):
-            module.fail_json(msg='datacenter parameter is required for creating, updating or deleting volumes.')
-
-        try:
-            (changed) = delete_volume(module, ionosenterprise)
-            module.exit_json(changed=changed)
-        except Exception as e:
-            module.fail_json(msg='failed to set volume state: %s' % to_native(e))
-
-    elif state == 'present':
-        if not module.params.get('datacenter'):
-            module.fail_json(msg='datacenter parameter is required for new instance')
-        if not module.params.get('name'):
-            module.fail_json(msg='name parameter is required for new instance')
-
-        try:
-            (volume_dict_array) = create_volume(module, ionosenterprise)
-            module.exit_json(**volume_dict_array)
-        except Exception as e:
-            module.fail_json(msg='failed to set volume state: %s' % to_native(e))
-
-    elif state == 'update':
-        try:
-            (volume_dict_array) = update_volume(module, ionosenterprise)
-            module.exit_json(**volume_dict_array)
-        except Exception as e:
-            module.fail_json(msg='failed to update volume: %s' % to_native(e))
+        module.exit_json(changed=result)
+    module.exit_json(**result)
 
 
 if __name__ == '__main__':